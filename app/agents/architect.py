@@ -7,6 +7,14 @@ from langchain_core.prompts import ChatPromptTemplate
 from app.agents.base import BaseAgent
 from app.graph.state import LabState
 
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_template("""Research Notes:
+{research}
+
+Requirements Context:
+{requirements}
+
+Architecture Design:""")
+
 
 class ArchitectAgent(BaseAgent):
     """Agent responsible for system architecture design."""
@@ -14,17 +22,11 @@ class ArchitectAgent(BaseAgent):
     def __init__(self):
         super().__init__("architect", temperature=0.2)
 
-    def get_prompt_template(self) -> ChatPromptTemplate:
-        """Get prompt template for architecture design."""
-        template = """You are the Architect Agent in a technical research lab.
-
-Your task is to design a comprehensive system architecture based on the research.
-
-Research Notes:
-{research}
+    def get_system_prompt(self) -> str:
+        """Get static instructions for architecture design."""
+        return """You are the Architect Agent in a technical research lab.
 
-Requirements Context:
-{requirements}
+Your task is to design a comprehensive system architecture based on the research notes and requirements context provided by the user.
 
 Please design a detailed system architecture that includes:
 
@@ -60,16 +62,16 @@ Please design a detailed system architecture that includes:
 
 Provide specific, implementable architectural decisions.
 Include technology choices with justification.
-Consider both functional and non-functional requirements.
-
-Architecture Design:"""
+Consider both functional and non-functional requirements."""
 
-        return ChatPromptTemplate.from_template(template)
+    def get_prompt_template(self) -> ChatPromptTemplate:
+        """Get prompt template for architecture design."""
+        return _PROMPT_TEMPLATE
 
     def process_response(self, response: str, state: LabState) -> Dict[str, Any]:
         """Process architect response."""
         return {
-            "architecture": response.strip(),
+            "architecture": response,
         }
 
     def _get_required_fields(self) -> list[str]:
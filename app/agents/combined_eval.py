@@ -0,0 +1,97 @@
+"""Combined evaluation agent scoring quality and bias in one LLM call."""
+
+from typing import Any, Dict
+
+import orjson
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.agents.base import BaseAgent
+from app.agents.critic import EVALUATION_CRITERIA, EVALUATION_JSON_FIELDS, CriticAgent
+from app.agents.meta_critic import RISK_CHECKLIST, MetaCriticAgent
+from app.graph.state import LabState
+
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_template("""Original Requirements:
+{requirements}
+
+Research Analysis:
+{research}
+
+Architecture Design:
+{architecture}
+
+Evaluation:""")
+
+
+class CombinedEvalAgent(BaseAgent):
+    """Agent performing critic and meta-critic evaluation in a single request.
+
+    Both evaluations read the same requirements and architecture, so sharing
+    one prompt pays for that context once instead of twice. Parsing reuses the
+    critic and meta-critic logic on the respective parts of the response.
+    """
+
+    def __init__(self):
+        super().__init__("evaluator", temperature=0.1)
+        self._critic = CriticAgent()
+        self._meta_critic = MetaCriticAgent()
+
+    def get_system_prompt(self) -> str:
+        """Get static instructions for combined evaluation."""
+        return f"""You are the Critic and Meta-Critic Agent in a technical research lab.
+
+Your task is to evaluate the quality and completeness of the system architecture provided by the user, together with the original requirements and research analysis, and to detect potential hallucinations, overconfidence, or bias in it.
+
+Part 1 - Quality Evaluation
+
+{EVALUATION_CRITERIA}
+
+Part 2 - Risk Assessment
+
+{RISK_CHECKLIST}
+
+Provide both evaluations in this exact JSON format:
+{{
+  "critic": {{
+    {EVALUATION_JSON_FIELDS}
+  }},
+  "meta": {{
+    "risk_score": [0.0-1.0],
+    "explanation": "[Brief explanation of the risk score]"
+  }}
+}}
+
+Be constructive but thorough in your evaluation.
+Provide specific, actionable feedback for improvements."""
+
+    def get_prompt_template(self) -> ChatPromptTemplate:
+        """Get prompt template for combined evaluation."""
+        return _PROMPT_TEMPLATE
+
+    def process_response(self, response: str, state: LabState) -> Dict[str, Any]:
+        """Process combined response into critic and bias scores."""
+        try:
+            result = self._critic._parse_json(response)
+            
+            evaluation = self._critic._evaluation_from_result(result["critic"])
+            evaluation["bias_score"] = self._bias_from_result(result["meta"])
+            return evaluation
+            
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            evaluation = self._critic._fallback_evaluation(response, e)
+            evaluation["bias_score"] = self._meta_critic._analyze_text_for_risk(response)
+            return evaluation
+
+    def _bias_from_result(self, meta: Dict[str, Any]) -> float:
+        """Extract the bias score from the parsed meta-critic section."""
+        risk_score = meta.get("risk_score")
+        
+        if isinstance(risk_score, (int, float)):
+            return min(max(float(risk_score), 0.0), 1.0)
+        
+        return self._meta_critic._score_from_text(
+            f"{risk_score or ''} {meta.get('explanation', '')}"
+        )
+
+    def _get_required_fields(self) -> list[str]:
+        """Required fields for combined evaluation agent."""
+        return ["requirements", "research", "architecture"]
@@ -1,27 +1,60 @@
 """Critic agent for evaluating architecture quality."""
 
-import json
+import hashlib
+import re
 from typing import Any, Dict
 
+import numpy as np
+import orjson
 from langchain_core.prompts import ChatPromptTemplate
 
 from app.agents.base import BaseAgent
 from app.graph.state import LabState
 
+# Rubric criteria averaged into the overall critic score
+RUBRIC_FIELDS = (
+    "completeness",
+    "technical_soundness",
+    "scalability",
+    "security",
+    "maintainability",
+    "performance",
+    "feasibility",
+)
+
+# Markdown code fence around a JSON response
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+# Fallback patterns for locating a score in free text
+_SCORE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"score[:\s]*(\d+(?:\.\d+)?)",
+        r"(\d+(?:\.\d+)?)[/\s]*10",
+        r"rating[:\s]*(\d+(?:\.\d+)?)",
+    )
+]
+
+EVALUATION_CRITERIA = """Evaluate the architecture against these criteria:
 
-class CriticAgent(BaseAgent):
-    """Agent responsible for evaluating and scoring architecture quality."""
-
-    def __init__(self):
-        super().__init__("critic", temperature=0.1)
-
-    def get_prompt_template(self) -> ChatPromptTemplate:
-        """Get prompt template for architecture evaluation."""
-        template = """You are the Critic Agent in a technical research lab.
+1. **Completeness** (0-10): Does it address all requirements?
+2. **Technical Soundness** (0-10): Are the technical decisions appropriate?
+3. **Scalability** (0-10): Can it handle growth and load?
+4. **Security** (0-10): Are security concerns properly addressed?
+5. **Maintainability** (0-10): Is the design maintainable and extensible?
+6. **Performance** (0-10): Will it meet performance requirements?
+7. **Feasibility** (0-10): Is the design realistic to implement?"""
 
-Your task is to evaluate the quality and completeness of the system architecture.
+EVALUATION_JSON_FIELDS = """"feedback": "[Detailed feedback explaining the scores, highlighting strengths and weaknesses, specific improvement suggestions]",
+    "completeness": [0-10],
+    "technical_soundness": [0-10],
+    "scalability": [0-10],
+    "security": [0-10],
+    "maintainability": [0-10],
+    "performance": [0-10],
+    "feasibility": [0-10]"""
 
-Original Requirements:
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_template("""Original Requirements:
 {requirements}
 
 Research Analysis:
@@ -30,77 +63,85 @@ Research Analysis:
 Architecture Design:
 {architecture}
 
-Evaluate the architecture against these criteria:
+Evaluation:""")
 
-1. **Completeness** (0-10): Does it address all requirements?
-2. **Technical Soundness** (0-10): Are the technical decisions appropriate?
-3. **Scalability** (0-10): Can it handle growth and load?
-4. **Security** (0-10): Are security concerns properly addressed?
-5. **Maintainability** (0-10): Is the design maintainable and extensible?
-6. **Performance** (0-10): Will it meet performance requirements?
-7. **Feasibility** (0-10): Is the design realistic to implement?
+
+class CriticAgent(BaseAgent):
+    """Agent responsible for evaluating and scoring architecture quality."""
+
+    def __init__(self):
+        super().__init__("critic", temperature=0.1)
+
+    def get_system_prompt(self) -> str:
+        """Get static instructions for architecture evaluation."""
+        return f"""You are the Critic Agent in a technical research lab.
+
+Your task is to evaluate the quality and completeness of the system architecture provided by the user, together with the original requirements and research analysis.
+
+{EVALUATION_CRITERIA}
 
 Provide your evaluation in this exact JSON format:
 {{
-    "score": [average score 0-10],
-    "feedback": "[Detailed feedback explaining the score, highlighting strengths and weaknesses, specific improvement suggestions]",
-    "completeness": [0-10],
-    "technical_soundness": [0-10],
-    "scalability": [0-10],
-    "security": [0-10],
-    "maintainability": [0-10],
-    "performance": [0-10],
-    "feasibility": [0-10]
+    {EVALUATION_JSON_FIELDS}
 }}
 
 Be constructive but thorough in your evaluation.
-Provide specific, actionable feedback for improvements.
-
-Evaluation:"""
+Provide specific, actionable feedback for improvements."""
 
-        return ChatPromptTemplate.from_template(template)
+    def get_prompt_template(self) -> ChatPromptTemplate:
+        """Get prompt template for architecture evaluation."""
+        return _PROMPT_TEMPLATE
 
     def process_response(self, response: str, state: LabState) -> Dict[str, Any]:
         """Process critic response and extract scores."""
         try:
-            # Try to parse JSON response
-            response_clean = response.strip()
-            if response_clean.startswith("```json"):
-                response_clean = response_clean[7:]
-            if response_clean.endswith("```"):
-                response_clean = response_clean[:-3]
-            
-            result = json.loads(response_clean.strip())
-            
-            return {
-                "critic_score": float(result.get("score", 5.0)),
-                "critic_feedback": result.get("feedback", "No feedback provided"),
-            }
-            
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            self.logger.warning("failed_to_parse_critic_response", error=str(e))
+            return self._evaluation_from_result(self._parse_json(response))
             
-            # Fallback: try to extract score from text
-            score = self._extract_score_from_text(response)
-            
-            return {
-                "critic_score": score,
-                "critic_feedback": f"Parsing failed. Raw response: {response[:500]}",
-            }
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            return self._fallback_evaluation(response, e)
+
+    def _parse_json(self, response: str) -> Dict[str, Any]:
+        """Parse a JSON object from a response, stripping Markdown code fences."""
+        return orjson.loads(_CODE_FENCE.sub("", response))
+
+    def _evaluation_from_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the critic state update from a parsed evaluation."""
+        # The overall score is derived from the rubric, not taken from the model
+        scores = np.fromiter(
+            (float(result.get(field, 5.0)) for field in RUBRIC_FIELDS),
+            dtype=np.float32,
+            count=len(RUBRIC_FIELDS),
+        )
+        
+        return {
+            "critic_score": round(float(np.clip(scores, 0.0, 10.0).mean()), 2),
+            "critic_feedback": result.get("feedback", "No feedback provided"),
+        }
+
+    def _fallback_evaluation(self, response: str, error: Exception) -> Dict[str, Any]:
+        """Build the critic state update from an unparseable response."""
+        # Keep the raw response in the logs only, not in workflow state
+        digest = hashlib.md5(response.encode(), usedforsecurity=False).hexdigest()
+        self.logger.warning(
+            "critic_parse_failed",
+            error=str(error),
+            hash=digest,
+            length=len(response),
+            prefix=response[:200],
+        )
+        
+        # Fallback: try to extract score from text
+        score = self._extract_score_from_text(response)
+        
+        return {
+            "critic_score": score,
+            "critic_feedback": f"parse_failed:{digest[:8]}",
+        }
 
     def _extract_score_from_text(self, text: str) -> float:
         """Extract a score from text as fallback."""
-        import re
-        
-        # Look for score patterns
-        score_patterns = [
-            r"score[:\s]*(\d+(?:\.\d+)?)",
-            r"(\d+(?:\.\d+)?)[/\s]*10",
-            r"rating[:\s]*(\d+(?:\.\d+)?)",
-        ]
-        
-        for pattern in score_patterns:
-            match = re.search(pattern, text.lower())
+        for pattern in _SCORE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     score = float(match.group(1))
@@ -8,26 +8,44 @@ from langchain_core.prompts import ChatPromptTemplate
 from app.agents.base import BaseAgent
 from app.graph.state import LabState
 
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency, see the "speedups" extra
+    ahocorasick = None
 
-class MetaCriticAgent(BaseAgent):
-    """Agent responsible for detecting hallucinations and bias in architecture."""
+_FIRST_NUMBER = re.compile(r"\d+(?:\.\d+)?")
 
-    def __init__(self):
-        super().__init__("meta_critic", temperature=0.1)
+_RISK_WORDS = (
+    # High risk indicators
+    ("major", ("hallucination", "false", "incorrect", "misleading", "bias")),
+    # Medium risk indicators
+    ("moderate", ("concern", "issue", "problem", "questionable", "unclear")),
+    # Low risk indicators
+    ("minor", ("minor", "small", "trivial", "acceptable")),
+)
 
-    def get_prompt_template(self) -> ChatPromptTemplate:
-        """Get prompt template for meta-evaluation."""
-        template = """You are the Meta-Critic Agent in a technical research lab.
+# One alternation per severity so a single scan finds all indicators
+_RISK_INDICATORS = re.compile(
+    "|".join(
+        f"(?P<{severity}>{'|'.join(words)})" for severity, words in _RISK_WORDS
+    ),
+    re.IGNORECASE,
+)
 
-Your task is to detect potential hallucinations, overconfidence, or bias in the architecture analysis.
 
-Architecture Design:
-{architecture}
+def _build_risk_automaton() -> "ahocorasick.Automaton":
+    """Build an Aho-Corasick automaton over all risk indicators."""
+    automaton = ahocorasick.Automaton()
+    for severity, words in _RISK_WORDS:
+        for word in words:
+            automaton.add_word(word, (word, severity))
+    automaton.make_automaton()
+    return automaton
 
-Requirements Context:
-{requirements}
 
-Analyze the architecture for these potential issues:
+_RISK_AUTOMATON = _build_risk_automaton() if ahocorasick is not None else None
+
+RISK_CHECKLIST = """Analyze the architecture for these potential issues:
 
 1. **Hallucination Detection**
    - Are there claims about specific technologies without proper justification?
@@ -54,30 +72,42 @@ Provide a risk score between 0.0 and 1.0 where:
 - 0.3 = Minor issues that should be noted
 - 0.5 = Moderate concerns requiring attention
 - 0.7 = Significant issues affecting credibility
-- 1.0 = Major hallucinations or bias detected
+- 1.0 = Major hallucinations or bias detected"""
+
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_template("""Architecture Design:
+{architecture}
+
+Requirements Context:
+{requirements}
 
-Return only the numerical risk score (e.g., 0.2) followed by a brief explanation.
+Risk Assessment:""")
 
-Risk Assessment:"""
 
-        return ChatPromptTemplate.from_template(template)
+class MetaCriticAgent(BaseAgent):
+    """Agent responsible for detecting hallucinations and bias in architecture."""
+
+    def __init__(self):
+        super().__init__("meta_critic", temperature=0.1)
+
+    def get_system_prompt(self) -> str:
+        """Get static instructions for meta-evaluation."""
+        return f"""You are the Meta-Critic Agent in a technical research lab.
+
+Your task is to detect potential hallucinations, overconfidence, or bias in the architecture design provided by the user.
+
+{RISK_CHECKLIST}
+
+Return only the numerical risk score (e.g., 0.2) followed by a brief explanation."""
+
+    def get_prompt_template(self) -> ChatPromptTemplate:
+        """Get prompt template for meta-evaluation."""
+        return _PROMPT_TEMPLATE
 
     def process_response(self, response: str, state: LabState) -> Dict[str, Any]:
         """Process meta-critic response and extract bias score."""
         try:
-            # Extract numerical score from response
-            score_match = re.search(r'(\d+(?:\.\d+)?)', response.strip())
-            
-            if score_match:
-                score = float(score_match.group(1))
-                # Ensure score is in valid range
-                score = min(max(score, 0.0), 1.0)
-            else:
-                # Fallback analysis based on keywords
-                score = self._analyze_text_for_risk(response)
-            
             return {
-                "bias_score": score,
+                "bias_score": self._score_from_text(response),
             }
             
         except (ValueError, AttributeError) as e:
@@ -86,22 +116,34 @@ Risk Assessment:"""
                 "bias_score": 0.5,  # Middle score as fallback
             }
 
+    def _score_from_text(self, text: str) -> float:
+        """Extract the risk score from a free-text assessment."""
+        # Extract numerical score from response
+        score_match = _FIRST_NUMBER.search(text)
+        
+        if score_match:
+            score = float(score_match.group())
+            # Ensure score is in valid range
+            return min(max(score, 0.0), 1.0)
+        
+        # Fallback analysis based on keywords
+        return self._analyze_text_for_risk(text)
+
     def _analyze_text_for_risk(self, text: str) -> float:
         """Analyze text for risk indicators as fallback."""
-        risk_indicators = {
-            # High risk indicators
-            "major": ["hallucination", "false", "incorrect", "misleading", "bias"],
-            # Medium risk indicators  
-            "moderate": ["concern", "issue", "problem", "questionable", "unclear"],
-            # Low risk indicators
-            "minor": ["minor", "small", "trivial", "acceptable"]
-        }
+        # Each distinct indicator counts once, however often it occurs
+        found: dict[str, set[str]] = {"major": set(), "moderate": set(), "minor": set()}
         
-        text_lower = text.lower()
+        if _RISK_AUTOMATON is not None:
+            for _, (word, severity) in _RISK_AUTOMATON.iter(text.lower()):
+                found[severity].add(word)
+        else:
+            for match in _RISK_INDICATORS.finditer(text):
+                found[match.lastgroup].add(match.group().lower())
         
-        major_count = sum(1 for word in risk_indicators["major"] if word in text_lower)
-        moderate_count = sum(1 for word in risk_indicators["moderate"] if word in text_lower)
-        minor_count = sum(1 for word in risk_indicators["minor"] if word in text_lower)
+        major_count = len(found["major"])
+        moderate_count = len(found["moderate"])
+        minor_count = len(found["minor"])
         
         if major_count > 0:
             return min(0.7 + (major_count * 0.1), 1.0)
@@ -7,6 +7,11 @@ from langchain_core.prompts import ChatPromptTemplate
 from app.agents.base import BaseAgent
 from app.graph.state import LabState
 
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_template("""User Query:
+{user_query}
+
+Requirements:""")
+
 
 class PlannerAgent(BaseAgent):
     """Agent responsible for extracting and structuring requirements."""
@@ -14,15 +19,12 @@ class PlannerAgent(BaseAgent):
     def __init__(self):
         super().__init__("planner", temperature=0.1)
 
-    def get_prompt_template(self) -> ChatPromptTemplate:
-        """Get prompt template for requirement extraction."""
-        template = """You are the Planner Agent in a technical research lab.
+    def get_system_prompt(self) -> str:
+        """Get static instructions for requirement extraction."""
+        return """You are the Planner Agent in a technical research lab.
 
 Your task is to analyze the user query and extract structured system requirements.
 
-User Query:
-{user_query}
-
 Please analyze the query and extract:
 1. Functional requirements (what the system should do)
 2. Non-functional requirements (performance, security, scalability)
@@ -30,16 +32,16 @@ Please analyze the query and extract:
 4. Success criteria
 
 Format your response as clear, actionable bullet points using Markdown.
-Be specific and technical. Focus on measurable requirements.
-
-Requirements:"""
+Be specific and technical. Focus on measurable requirements."""
 
-        return ChatPromptTemplate.from_template(template)
+    def get_prompt_template(self) -> ChatPromptTemplate:
+        """Get prompt template for requirement extraction."""
+        return _PROMPT_TEMPLATE
 
     def process_response(self, response: str, state: LabState) -> Dict[str, Any]:
         """Process planner response."""
         return {
-            "requirements": response.strip(),
+            "requirements": response,
         }
 
     def _get_required_fields(self) -> list[str]:
@@ -7,6 +7,11 @@ from langchain_core.prompts import ChatPromptTemplate
 from app.agents.base import BaseAgent
 from app.graph.state import LabState
 
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_template("""Requirements:
+{requirements}
+
+Research Analysis:""")
+
 
 class ResearcherAgent(BaseAgent):
     """Agent responsible for deep technical research and analysis."""
@@ -14,14 +19,11 @@ class ResearcherAgent(BaseAgent):
     def __init__(self):
         super().__init__("researcher", temperature=0.4)
 
-    def get_prompt_template(self) -> ChatPromptTemplate:
-        """Get prompt template for technical research."""
-        template = """You are the Researcher Agent in a technical research lab.
-
-Your task is to provide deep technical analysis and research based on the requirements.
+    def get_system_prompt(self) -> str:
+        """Get static instructions for technical research."""
+        return """You are the Researcher Agent in a technical research lab.
 
-Requirements:
-{requirements}
+Your task is to provide deep technical analysis and research based on the requirements provided by the user.
 
 Please provide comprehensive research covering:
 
@@ -46,16 +48,16 @@ Please provide comprehensive research covering:
    - Resource requirements
 
 Provide detailed, technical explanations with specific examples.
-Focus on actionable insights that will guide the architecture design.
-
-Research Analysis:"""
+Focus on actionable insights that will guide the architecture design."""
 
-        return ChatPromptTemplate.from_template(template)
+    def get_prompt_template(self) -> ChatPromptTemplate:
+        """Get prompt template for technical research."""
+        return _PROMPT_TEMPLATE
 
     def process_response(self, response: str, state: LabState) -> Dict[str, Any]:
         """Process researcher response."""
         return {
-            "research": response.strip(),
+            "research": response,
         }
 
     def _get_required_fields(self) -> list[str]:
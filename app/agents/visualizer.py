@@ -7,6 +7,11 @@ from langchain_core.prompts import ChatPromptTemplate
 from app.agents.base import BaseAgent
 from app.graph.state import LabState
 
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_template("""Architecture Design:
+{architecture}
+
+Visual Documentation:""")
+
 
 class VisualizerAgent(BaseAgent):
     """Agent responsible for creating visual representations and diagrams."""
@@ -14,14 +19,11 @@ class VisualizerAgent(BaseAgent):
     def __init__(self):
         super().__init__("visualizer", temperature=0.1)
 
-    def get_prompt_template(self) -> ChatPromptTemplate:
-        """Get prompt template for visualization."""
-        template = """You are the Visualizer Agent in a technical research lab.
-
-Your task is to create clear visual representations of the system architecture.
+    def get_system_prompt(self) -> str:
+        """Get static instructions for visualization."""
+        return """You are the Visualizer Agent in a technical research lab.
 
-Architecture Design:
-{architecture}
+Your task is to create clear visual representations of the system architecture provided by the user.
 
 Create comprehensive visual documentation including:
 
@@ -57,16 +59,16 @@ Guidelines:
 - Use consistent naming
 - Add brief explanations for each diagram
 
-Focus on creating diagrams that effectively communicate the architecture.
-
-Visual Documentation:"""
+Focus on creating diagrams that effectively communicate the architecture."""
 
-        return ChatPromptTemplate.from_template(template)
+    def get_prompt_template(self) -> ChatPromptTemplate:
+        """Get prompt template for visualization."""
+        return _PROMPT_TEMPLATE
 
     def process_response(self, response: str, state: LabState) -> Dict[str, Any]:
         """Process visualizer response."""
         return {
-            "visualization": response.strip(),
+            "visualization": response,
         }
 
     def _get_required_fields(self) -> list[str]:
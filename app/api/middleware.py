@@ -0,0 +1,41 @@
+"""ASGI middleware for per-request context."""
+
+import itertools
+import os
+from contextvars import ContextVar
+from typing import Optional
+
+import structlog
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Correlation IDs only need to be unique per process: PID plus a counter
+_request_counter = itertools.count()
+
+# ID of the request being handled, readable anywhere in its call chain
+REQUEST_ID: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+class RequestContextMiddleware:
+    """Assign a request ID and bind it, the path and method to log context."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = f"{os.getpid():x}-{next(_request_counter):x}"
+        
+        # Set and cleared on entry rather than reset on exit so the outermost
+        # error handler still sees the request ID and log context
+        REQUEST_ID.set(request_id)
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(
+            request_id=request_id,
+            path=scope["path"],
+            method=scope["method"],
+        )
+        
+        await self.app(scope, receive, send)
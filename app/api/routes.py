@@ -1,20 +1,25 @@
 """Main API routes for OrchestraLab AI."""
 
 import time
-import uuid
-from typing import Dict, Any
+from datetime import datetime
+from typing import AsyncIterator, Dict, Any
 
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, StreamingResponse
+from langgraph.graph import END
 
+from app.api.middleware import REQUEST_ID
 from app.schemas.api import (
     AnalyzeRequest, 
     AnalyzeResponse, 
     HealthResponse,
     ErrorResponse
 )
+from app.cache.semantic import get_semantic_cache
 from app.graph.builder import get_workflow
+from app.graph.state import create_initial_state
 from app.core.config import get_settings
 from app.utils.exceptions import OrchestraLabError, ValidationError, RateLimitError
 from app.monitoring.metrics import MetricsCollector
@@ -39,10 +44,8 @@ async def get_workflow_dependency():
 # Dependency for request validation and rate limiting
 async def validate_request(request: Request) -> str:
     """Validate request and return request ID."""
-    request_id = str(uuid.uuid4())
-    
-    # Add request ID to context
-    request.state.request_id = request_id
+    # Assigned by RequestContextMiddleware
+    request_id = REQUEST_ID.get()
     
     # Basic rate limiting check (implementation depends on your needs)
     # This is a simple example - in production, use Redis or similar
@@ -68,23 +71,35 @@ async def analyze_system(
             query_length=len(request.query)
         )
         
+        # Serve near-duplicate queries from the semantic cache
+        cache = get_semantic_cache()
+        embedding = None
+        if cache is not None:
+            try:
+                embedding = await cache.embed(request.query)
+            except Exception as e:
+                logger.warning("query_embedding_failed", request_id=request_id, error=str(e))
+            else:
+                cached = cache.search(embedding)
+                if cached is not None:
+                    processing_time = time.time() - start_time
+                    logger.info(
+                        "analysis_cache_hit",
+                        request_id=request_id,
+                        processing_time=processing_time
+                    )
+                    MetricsCollector.record_request_duration(processing_time)
+                    MetricsCollector.record_request_success()
+                    return cached.model_copy(update={
+                        "processing_time": processing_time,
+                        "timestamp": datetime.utcnow(),
+                    })
+        
         # Initialize state
-        initial_state = {
-            "user_query": request.query,
-            "requirements": "",
-            "research": "",
-            "architecture": "",
-            "visualization": "",
-            "critic_score": 0.0,
-            "critic_feedback": "",
-            "bias_score": 0.0,
-            "final_markdown": "",
-            "iteration_count": 0,
-            "error_messages": [],
-        }
+        initial_state = create_initial_state(request.query)
         
         # Execute workflow
-        result = workflow.invoke(initial_state)
+        result = await workflow.ainvoke(initial_state)
         
         processing_time = time.time() - start_time
         
@@ -100,7 +115,7 @@ async def analyze_system(
         MetricsCollector.record_request_duration(processing_time)
         MetricsCollector.record_request_success()
         
-        return AnalyzeResponse(
+        response = AnalyzeResponse(
             final_markdown=result.get("final_markdown", "No output generated"),
             critic_score=result.get("critic_score", 0.0),
             bias_score=result.get("bias_score", 0.0),
@@ -108,6 +123,12 @@ async def analyze_system(
             processing_time=processing_time
         )
         
+        # Only cache complete analyses
+        if embedding is not None and not result.get("error_messages"):
+            cache.add(embedding, response)
+        
+        return response
+        
     except ValidationError as e:
         logger.warning("validation_error", request_id=request_id, error=str(e))
         MetricsCollector.record_request_error("validation")
@@ -132,6 +153,88 @@ async def analyze_system(
         )
 
 
+def _sse(event: str, data: Any) -> bytes:
+    """Encode one server-sent event."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@router.post("/analyze/stream")
+async def analyze_system_stream(
+    request: AnalyzeRequest,
+    workflow=Depends(get_workflow_dependency),
+    request_id: str = Depends(validate_request)
+) -> StreamingResponse:
+    """Stream each agent's output, then the final analysis, as server-sent events."""
+    
+    async def events() -> AsyncIterator[bytes]:
+        start_time = time.time()
+        result = create_initial_state(request.query)
+        
+        try:
+            logger.info(
+                "analysis_stream_started",
+                request_id=request_id,
+                query_length=len(request.query)
+            )
+            
+            async for step in workflow.astream(result):
+                for node, update in step.items():
+                    if node == END:
+                        result = update
+                        continue
+                    if not update:
+                        continue
+                    
+                    # Error messages are deltas; everything else overwrites
+                    errors = result["error_messages"] + update.get("error_messages", [])
+                    result.update(update)
+                    result["error_messages"] = errors
+                    
+                    yield _sse("node", {"node": node, "update": update})
+            
+            processing_time = time.time() - start_time
+            
+            logger.info(
+                "analysis_stream_completed",
+                request_id=request_id,
+                processing_time=processing_time,
+                critic_score=result.get("critic_score", 0.0),
+                iterations=result.get("iteration_count", 0)
+            )
+            
+            MetricsCollector.record_request_duration(processing_time)
+            MetricsCollector.record_request_success()
+            
+            response = AnalyzeResponse(
+                final_markdown=result.get("final_markdown", "No output generated"),
+                critic_score=result.get("critic_score", 0.0),
+                bias_score=result.get("bias_score", 0.0),
+                iteration_count=result.get("iteration_count", 0),
+                processing_time=processing_time
+            )
+            yield _sse("result", response.model_dump())
+            
+        except RateLimitError as e:
+            logger.warning("rate_limit_error", request_id=request_id, error=str(e))
+            MetricsCollector.record_request_error("rate_limit")
+            yield _sse("error", ErrorResponse(
+                error=str(e),
+                error_code="HTTP_429",
+                request_id=request_id
+            ).model_dump())
+            
+        except Exception as e:
+            logger.error("unexpected_error", request_id=request_id, error=str(e))
+            MetricsCollector.record_request_error("unexpected")
+            yield _sse("error", ErrorResponse(
+                error="An unexpected error occurred during analysis",
+                error_code="INTERNAL_ERROR",
+                request_id=request_id
+            ).model_dump())
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """Health check endpoint."""
@@ -150,10 +253,10 @@ async def get_metrics():
     
     # In development, allow metrics access
     if settings.environment != "production":
-        from prometheus_client import generate_latest
-        return JSONResponse(
-            content=generate_latest().decode("utf-8"),
-            media_type="text/plain"
+        from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+        return Response(
+            content=generate_latest(),
+            media_type=CONTENT_TYPE_LATEST
         )
     else:
         raise HTTPException(
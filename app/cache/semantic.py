@@ -0,0 +1,104 @@
+"""Semantic response cache keyed by query embeddings."""
+
+import asyncio
+from functools import lru_cache
+from typing import Generic, Optional, TypeVar
+
+import numpy as np
+import structlog
+
+from app.core.config import get_settings
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional dependency, see the "cache" extra
+    SentenceTransformer = None
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SemanticCache(Generic[T]):
+    """In-memory cache returning stored values for semantically similar queries.
+
+    Embeddings are L2-normalized and kept in a preallocated float32 matrix used
+    as a ring buffer, so a lookup is a single matrix-vector product and the
+    oldest entries are overwritten once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+    ):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model: Optional["SentenceTransformer"] = None
+        self._embeddings: Optional[np.ndarray] = None
+        self._values: list[Optional[T]] = [None] * max_entries
+        self._size = 0
+        self._next = 0
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed text locally without blocking the event loop."""
+        return await asyncio.to_thread(self._encode, text)
+
+    def _encode(self, text: str) -> np.ndarray:
+        """Encode text into a normalized float32 vector."""
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        
+        embedding = self._model.encode(text, normalize_embeddings=True)
+        return np.asarray(embedding, dtype=np.float32)
+
+    def search(self, embedding: np.ndarray) -> Optional[T]:
+        """Return the cached value most similar to the embedding, if close enough."""
+        if self._size == 0:
+            return None
+        
+        # Cosine similarity, since all stored vectors are normalized
+        scores = self._embeddings[:self._size] @ embedding
+        best = int(np.argmax(scores))
+        
+        if scores[best] < self.threshold:
+            return None
+        
+        logger.debug("semantic_cache_hit", similarity=float(scores[best]))
+        return self._values[best]
+
+    def add(self, embedding: np.ndarray, value: T) -> None:
+        """Store a value under the given embedding."""
+        if self._embeddings is None:
+            self._embeddings = np.zeros(
+                (self.max_entries, embedding.shape[0]), dtype=np.float32
+            )
+        
+        self._embeddings[self._next] = embedding
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+
+@lru_cache()
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Get the shared semantic cache, or None when it is disabled."""
+    settings = get_settings()
+    
+    if not settings.semantic_cache_enabled:
+        return None
+    
+    if SentenceTransformer is None:
+        logger.warning(
+            "semantic_cache_disabled",
+            reason="sentence-transformers is not installed"
+        )
+        return None
+    
+    return SemanticCache(
+        model_name=settings.embedding_model,
+        threshold=settings.semantic_cache_threshold,
+        max_entries=settings.semantic_cache_max_entries,
+    )
@@ -1,7 +1,7 @@
 """Application configuration with security best practices."""
 
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
@@ -36,6 +36,12 @@ class Settings(BaseSettings):
         le=10.0,
         description="Quality threshold for critic agent"
     )
+    bias_threshold: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=1.0,
+        description="Bias risk below which the workflow finishes without retry"
+    )
     max_retries: int = Field(
         default=3,
         ge=1,
@@ -49,6 +55,82 @@ class Settings(BaseSettings):
         description="Request timeout in seconds"
     )
 
+    # Request batching
+    llm_batch_size: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum LLM calls sent together in one batch"
+    )
+    llm_batch_window_ms: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        description="Time to collect concurrent LLM calls into a batch"
+    )
+    llm_batch_max_cost: int = Field(
+        default=8192,
+        ge=1,
+        description="Maximum combined prompt characters in one batch"
+    )
+
+    # Provider prompt caching
+    prompt_cache_warming: bool = Field(
+        default=True,
+        description="Warm downstream agent prompt prefixes while streaming"
+    )
+
+    # Semantic response cache
+    semantic_cache_enabled: bool = Field(
+        default=True,
+        description="Serve near-duplicate queries from the semantic cache"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for a semantic cache hit"
+    )
+    semantic_cache_max_entries: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of cached analysis responses"
+    )
+    embedding_model: str = Field(
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        description="Local sentence-transformers model used for query embeddings"
+    )
+
+    # LLM response cache
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Cache responses of low-temperature agents"
+    )
+    llm_cache_max_temperature: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=2.0,
+        description="Highest agent temperature whose responses are cached"
+    )
+    llm_cache_ttl: int = Field(
+        default=3600,
+        ge=1,
+        description="LLM response cache TTL in seconds"
+    )
+    node_cache_enabled: bool = Field(
+        default=True,
+        description="Replay workflow nodes whose upstream inputs are unchanged"
+    )
+    node_cache_ttl: int = Field(
+        default=3600,
+        ge=1,
+        description="Workflow node cache TTL in seconds"
+    )
+    redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis URL for shared caches (in-memory when unset)"
+    )
+
     # Security (optional for API key auth)
     api_key_header: str = Field(
         default="X-API-Key",
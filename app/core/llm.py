@@ -1,10 +1,15 @@
 """LLM client with error handling and security measures."""
 
 import asyncio
+import threading
+import time
 from functools import lru_cache
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict
 
+import httpx
+import openai
 import structlog
+from openai import RateLimitError as OpenAIRateLimitError
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import BaseMessage
 
@@ -20,46 +25,88 @@ class SecureLLMClient:
     def __init__(self, temperature: float = 0.3):
         self.settings = get_settings()
         self.temperature = temperature
-        self._client: Optional[ChatOpenAI] = None
-        self._rate_limiter = asyncio.Semaphore(
-            self.settings.rate_limit_per_minute
-        )
-
-    @property
-    def client(self) -> ChatOpenAI:
-        """Get or create LLM client."""
-        if self._client is None:
-            self._client = ChatOpenAI(
-                model=self.settings.model_name,
-                openai_api_key=self.settings.openrouter_api_key,
-                openai_api_base=self.settings.openrouter_base_url,
-                temperature=self.temperature,
+        self.client = ChatOpenAI(
+            model=self.settings.model_name,
+            openai_api_key=self.settings.openrouter_api_key,
+            openai_api_base=self.settings.openrouter_base_url,
+            temperature=temperature,
+            timeout=self.settings.request_timeout,
+            max_retries=self.settings.max_retries,
+            # Share one keep-alive connection pool across all clients
+            async_client=openai.AsyncOpenAI(
+                api_key=self.settings.openrouter_api_key,
+                base_url=self.settings.openrouter_base_url,
                 timeout=self.settings.request_timeout,
                 max_retries=self.settings.max_retries,
-            )
-        return self._client
+                http_client=get_async_http_client(),
+            ).chat.completions,
+        )
+        
+        # Token bucket: refills continuously, bursts up to a minute's quota
+        self._rate = self.settings.rate_limit_per_minute / 60.0
+        self._capacity = float(self.settings.rate_limit_per_minute)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._rate_lock = asyncio.Lock()
 
     async def invoke(self, messages: list[BaseMessage]) -> str:
         """Invoke LLM with rate limiting and error handling."""
-        async with self._rate_limiter:
-            try:
-                logger.info("invoking_llm", model=self.settings.model_name)
-                
-                response = await asyncio.to_thread(
-                    self.client.invoke,
-                    messages
-                )
-                
-                logger.info("llm_response_received", length=len(response.content))
-                return response.content
-                
-            except Exception as e:
-                logger.error("llm_invocation_failed", error=str(e))
-                
-                if "rate limit" in str(e).lower():
-                    raise RateLimitError("Rate limit exceeded") from e
-                
-                raise LLMError(f"LLM invocation failed: {str(e)}") from e
+        await self._acquire_token()
+        
+        try:
+            logger.info("invoking_llm", model=self.settings.model_name)
+            
+            response = await self.client.ainvoke(messages)
+            
+            logger.info("llm_response_received", length=len(response.content))
+            return response.content
+            
+        except OpenAIRateLimitError as e:
+            logger.error("llm_rate_limited", error=str(e))
+            raise RateLimitError("Rate limit exceeded") from e
+            
+        except Exception as e:
+            logger.error("llm_invocation_failed", error=str(e))
+            raise LLMError(f"LLM invocation failed: {str(e)}") from e
+
+    async def stream(self, messages: list[BaseMessage]) -> AsyncIterator[str]:
+        """Stream the LLM response with rate limiting and error handling."""
+        await self._acquire_token()
+        
+        try:
+            logger.info("streaming_llm", model=self.settings.model_name)
+            
+            async for chunk in self.client.astream(messages):
+                if chunk.content:
+                    yield chunk.content
+            
+        except OpenAIRateLimitError as e:
+            logger.error("llm_rate_limited", error=str(e))
+            raise RateLimitError("Rate limit exceeded") from e
+            
+        except Exception as e:
+            logger.error("llm_stream_failed", error=str(e))
+            raise LLMError(f"LLM streaming failed: {str(e)}") from e
+
+    async def _acquire_token(self) -> None:
+        """Wait for a rate limit token without holding the lock while sleeping."""
+        while True:
+            async with self._rate_lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            
+            await asyncio.sleep(wait)
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
 
     def validate_input(self, text: str) -> bool:
         """Validate input text for security."""
@@ -74,6 +121,30 @@ class SecureLLMClient:
 
 
 @lru_cache()
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the HTTP/2 connection pool shared by all LLM clients."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        timeout=get_settings().request_timeout,
+    )
+
+
+# Clients by rounded temperature; agents use only a handful of values
+_LLM_CLIENTS: Dict[float, SecureLLMClient] = {}
+_LLM_CLIENTS_LOCK = threading.Lock()
+
+
 def get_llm_client(temperature: float = 0.3) -> SecureLLMClient:
     """Get cached LLM client instance."""
-    return SecureLLMClient(temperature=temperature)
\ No newline at end of file
+    # Rounded so equal temperatures always share a client
+    temperature = round(temperature, 2)
+    client = _LLM_CLIENTS.get(temperature)
+    if client is None:
+        with _LLM_CLIENTS_LOCK:
+            client = _LLM_CLIENTS.get(temperature)
+            if client is None:
+                client = _LLM_CLIENTS[temperature] = SecureLLMClient(
+                    temperature=temperature
+                )
+    return client
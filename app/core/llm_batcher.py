@@ -0,0 +1,154 @@
+"""Micro-batching of concurrent LLM requests."""
+
+import asyncio
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import structlog
+from langchain_core.messages import BaseMessage
+
+from app.core.config import get_settings
+from app.core.llm import get_llm_client
+
+logger = structlog.get_logger(__name__)
+
+# Upper cost bounds of the small and medium buckets; larger calls are "large"
+BUCKET_BOUNDS = (512, 2048)
+
+
+def prompt_cost(messages: list[BaseMessage]) -> int:
+    """Estimate the prefill cost of a call from its per-request prompt.
+
+    The static system prefix is shared by every call of an agent and served
+    from the provider prompt cache, so only the last message is counted.
+    """
+    content = messages[-1].content
+    return len(content) if isinstance(content, str) else len(str(content))
+
+
+class LLMBatcher:
+    """Coalesce concurrent LLM calls into length-bucketed batches.
+
+    Calls are assigned to a small, medium or large bucket by ``cost_fn`` so
+    short prompts are not held back by the prefill of long ones. Each bucket
+    is flushed independently, ``window`` seconds after its first call or as
+    soon as it holds ``max_batch_size`` calls or ``max_cost_per_batch`` cost,
+    and sent with ``client.abatch``. Calls sharing a ``key`` while one is in
+    flight are answered by the same request.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_batch_size: int = 8,
+        window: float = 0.02,
+        cost_fn: Callable[[Any], int] = prompt_cost,
+        max_cost_per_batch: int = 8192,
+    ):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.cost_fn = cost_fn
+        self.max_cost_per_batch = max_cost_per_batch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._buckets: list[list[tuple[Any, asyncio.Future]]] = []
+        self._costs: list[int] = []
+        self._timers: list[Optional[asyncio.TimerHandle]] = []
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def ainvoke(
+        self, messages: list[BaseMessage], key: Optional[str] = None
+    ) -> BaseMessage:
+        """Invoke the LLM through the batch buckets."""
+        self._ensure_loop()
+        
+        future = self._in_flight.get(key) if key is not None else None
+        if future is None:
+            future = self._loop.create_future()
+            if key is not None:
+                self._in_flight[key] = future
+                future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self._enqueue(messages, future)
+        else:
+            logger.debug("llm_request_coalesced")
+        
+        # Shield so one cancelled caller does not cancel a shared request
+        return await asyncio.shield(future)
+
+    def _ensure_loop(self) -> None:
+        """Reset batching state when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        
+        if self._loop is not loop:
+            self._loop = loop
+            self._buckets = [[] for _ in range(len(BUCKET_BOUNDS) + 1)]
+            self._costs = [0] * len(self._buckets)
+            self._timers = [None] * len(self._buckets)
+            self._in_flight = {}
+
+    def _enqueue(self, messages: list[BaseMessage], future: asyncio.Future) -> None:
+        """Add a call to its bucket and flush the bucket when it is full."""
+        cost = self.cost_fn(messages)
+        index = bisect_right(BUCKET_BOUNDS, cost)
+        
+        if self._buckets[index] and self._costs[index] + cost > self.max_cost_per_batch:
+            self._flush(index)
+        
+        self._buckets[index].append((messages, future))
+        self._costs[index] += cost
+        
+        if (
+            len(self._buckets[index]) >= self.max_batch_size
+            or self._costs[index] >= self.max_cost_per_batch
+        ):
+            self._flush(index)
+        elif self._timers[index] is None:
+            self._timers[index] = self._loop.call_later(self.window, self._flush, index)
+
+    def _flush(self, index: int) -> None:
+        """Dispatch the calls collected in a bucket."""
+        if self._timers[index] is not None:
+            self._timers[index].cancel()
+            self._timers[index] = None
+        
+        batch = self._buckets[index]
+        self._buckets[index] = []
+        self._costs[index] = 0
+        
+        if batch:
+            task = self._loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        """Send one batch and resolve its futures positionally."""
+        logger.debug("llm_batch_dispatched", size=len(batch))
+        
+        try:
+            results = await self.client.abatch(
+                [messages for messages, _ in batch], return_exceptions=True
+            )
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+@lru_cache()
+def get_llm_batcher(temperature: float = 0.3) -> LLMBatcher:
+    """Get the shared batcher for the LLM client at a temperature."""
+    settings = get_settings()
+    return LLMBatcher(
+        get_llm_client(temperature).client,
+        max_batch_size=settings.llm_batch_size,
+        window=settings.llm_batch_window_ms / 1000,
+        max_cost_per_batch=settings.llm_batch_max_cost,
+    )
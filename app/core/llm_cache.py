@@ -0,0 +1,111 @@
+"""Exact-match cache for deterministic LLM responses."""
+
+import hashlib
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+import structlog
+
+from app.core.config import get_settings
+
+try:
+    import redis
+except ImportError:  # Optional dependency, see the "cache" extra
+    redis = None
+
+logger = structlog.get_logger(__name__)
+
+
+class LLMCache:
+    """Content-addressed LLM response cache with TTL.
+
+    The backend is either a plain dict (in-process, bounded by ``max_entries``)
+    or a Redis-like client exposing ``get`` and ``set(key, value, ex=ttl)``.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Any] = None,
+        ttl: int = 3600,
+        max_entries: int = 4096,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._backend = {} if backend is None else backend
+        self._local = isinstance(self._backend, dict)
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Build a cache key from its parts, e.g. model, temperature and prompt."""
+        digest = hashlib.blake2b(digest_size=16)
+        for index, part in enumerate(parts):
+            if index:
+                digest.update(b"|")
+            digest.update(str(part).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None on miss or expiry."""
+        if not self._local:
+            value = self._backend.get(key)
+            return value.decode() if isinstance(value, bytes) else value
+        
+        entry = self._backend.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._backend.pop(key, None)
+            return None
+        
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Cache a response."""
+        if not self._local:
+            self._backend.set(key, value, ex=self.ttl)
+            return
+        
+        # Evict the oldest entry; dicts preserve insertion order
+        if len(self._backend) >= self.max_entries and key not in self._backend:
+            self._backend.pop(next(iter(self._backend)))
+        
+        self._backend[key] = (time.monotonic() + self.ttl, value)
+
+
+@lru_cache()
+def get_llm_cache() -> Optional[LLMCache]:
+    """Get the shared LLM response cache, or None when it is disabled."""
+    settings = get_settings()
+    
+    if not settings.llm_cache_enabled:
+        return None
+    
+    return LLMCache(backend=_create_backend(), ttl=settings.llm_cache_ttl)
+
+
+@lru_cache()
+def get_node_cache() -> Optional[LLMCache]:
+    """Get the shared workflow node cache, or None when it is disabled."""
+    settings = get_settings()
+    
+    if not settings.node_cache_enabled:
+        return None
+    
+    return LLMCache(backend=_create_backend(), ttl=settings.node_cache_ttl)
+
+
+def _create_backend() -> Optional[Any]:
+    """Create the Redis backend if configured, otherwise None for in-memory."""
+    settings = get_settings()
+    
+    if not settings.redis_url:
+        return None
+    
+    if redis is None:
+        logger.warning("redis_unavailable", fallback="in-memory cache")
+        return None
+    
+    return redis.Redis.from_url(settings.redis_url)
@@ -14,6 +14,7 @@ def setup_logging() -> None:
     settings = get_settings()
     
     processors: list[Processor] = [
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
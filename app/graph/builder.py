@@ -1,16 +1,56 @@
 """LangGraph workflow builder with error handling."""
 
-from typing import Any, Dict, Literal, Optional
+import asyncio
+import io
+import itertools
+import re
+from functools import lru_cache
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Literal, Optional,
+    Tuple,
+)
 
+import orjson
 import structlog
 from langgraph.graph import StateGraph, END
 
-from app.graph.state import LabState
+from app.agents.architect import ArchitectAgent
+from app.agents.base import BaseAgent
+from app.agents.combined_eval import CombinedEvalAgent
+from app.agents.planner import PlannerAgent
+from app.agents.researcher import ResearcherAgent
+from app.agents.visualizer import VisualizerAgent
+from app.graph.state import LabState, create_initial_state
 from app.core.config import get_settings
+from app.core.llm_cache import get_node_cache
 from app.utils.exceptions import GraphError
 
 logger = structlog.get_logger(__name__)
 
+# Generated characters after which downstream prompt prefixes are warmed
+_WARM_AFTER_CHARS = 2048
+
+# Critic feedback pointing at missing or weak research rather than design
+_RESEARCH_GAP = re.compile(
+    r"\bresearch\w*\b[^.]{0,60}?\b(?:gaps?|missing|lacks?|lacking|insufficient|"
+    r"incomplete|shallow|outdated)\b"
+    r"|\b(?:gaps?|missing|lacks?|lacking|insufficient|incomplete|shallow|outdated)\b"
+    r"[^.]{0,60}?\bresearch",
+    re.IGNORECASE,
+)
+
+# State fields rendered into the final markdown, in order
+_OUTPUT_SECTIONS = (
+    ("requirements", "Requirements"),
+    ("research", "Research Notes"),
+    ("architecture", "Architecture Design"),
+    ("visualization", "Visualization"),
+)
+_SECTION_SEPARATOR = "\n\n---\n\n"
+
+# Async graph node: takes the state and returns a state update
+_Node = Callable[[LabState], Awaitable[Dict[str, Any]]]
+
 
 class WorkflowBuilder:
     """Build and configure the multi-agent workflow."""
@@ -18,6 +58,7 @@ class WorkflowBuilder:
     def __init__(self):
         self.settings = get_settings()
         self.graph: Optional[StateGraph] = None
+        self._background_tasks: set[asyncio.Task] = set()
 
     def build_graph(self) -> StateGraph:
         """Build the complete workflow graph."""
@@ -25,14 +66,6 @@ class WorkflowBuilder:
             return self.graph
 
         try:
-            # Import agents here to avoid circular imports
-            from app.agents.planner import PlannerAgent
-            from app.agents.researcher import ResearcherAgent
-            from app.agents.architect import ArchitectAgent
-            from app.agents.visualizer import VisualizerAgent
-            from app.agents.critic import CriticAgent
-            from app.agents.meta_critic import MetaCriticAgent
-
             # Create workflow
             workflow = StateGraph(LabState)
 
@@ -41,16 +74,41 @@ class WorkflowBuilder:
             researcher = ResearcherAgent()
             architect = ArchitectAgent()
             visualizer = VisualizerAgent()
-            critic = CriticAgent()
-            meta_critic = MetaCriticAgent()
-
-            # Add nodes
-            workflow.add_node("planner", planner.execute)
-            workflow.add_node("researcher", researcher.execute)
-            workflow.add_node("architect", architect.execute)
-            workflow.add_node("visualizer", visualizer.execute)
-            workflow.add_node("critic", critic.execute)
-            workflow.add_node("meta_critic", meta_critic.execute)
+            evaluator = CombinedEvalAgent()
+
+            # Add nodes, replaying cached updates for unchanged upstream inputs
+            workflow.add_node(
+                "planner",
+                self._cached_node("planner", planner.aexecute, "user_query")
+            )
+            # Long-running agents stream and warm the next agents' prefixes
+            workflow.add_node(
+                "researcher",
+                self._cached_node(
+                    "researcher",
+                    self._streaming_node(researcher, architect),
+                    "requirements", "critic_feedback",
+                )
+            )
+            # Feedback is part of the key so retries produce a new design
+            workflow.add_node(
+                "architect",
+                self._cached_node(
+                    "architect",
+                    self._streaming_node(architect, evaluator, visualizer),
+                    "requirements", "research", "critic_feedback",
+                )
+            )
+            # Evaluation and visualization only depend on the architecture
+            workflow.add_node(
+                "evaluate",
+                self._parallel_node(
+                    evaluator.aexecute,
+                    self._cached_node(
+                        "visualizer", visualizer.aexecute, "architecture"
+                    ),
+                )
+            )
             workflow.add_node("finalize", self._finalize_output)
 
             # Set entry point
@@ -59,20 +117,19 @@ class WorkflowBuilder:
             # Define workflow edges
             workflow.add_edge("planner", "researcher")
             workflow.add_edge("researcher", "architect")
-            workflow.add_edge("architect", "visualizer")
-            workflow.add_edge("visualizer", "critic")
+            workflow.add_edge("architect", "evaluate")
 
             # Conditional edge for retry logic
             workflow.add_conditional_edges(
-                "critic",
+                "evaluate",
                 self._should_retry,
                 {
-                    "retry": "researcher",
-                    "proceed": "meta_critic"
+                    "retry": "architect",
+                    "research": "researcher",
+                    "proceed": "finalize"
                 }
             )
 
-            workflow.add_edge("meta_critic", "finalize")
             workflow.add_edge("finalize", END)
 
             # Compile without checkpointer for simpler usage
@@ -85,13 +142,110 @@ class WorkflowBuilder:
             logger.error("workflow_build_failed", error=str(e))
             raise GraphError(f"Failed to build workflow graph: {str(e)}") from e
 
-    def _should_retry(self, state: LabState) -> Literal["retry", "proceed"]:
-        """Determine if workflow should retry based on critic score."""
+    def _cached_node(self, name: str, node: _Node, *key_fields: str) -> _Node:
+        """Wrap a node so identical upstream inputs replay its cached update.
+
+        The key is built from ``key_fields`` of the incoming state. Failed
+        updates are never cached, and ``iteration_count`` is recomputed on a
+        hit rather than replayed.
+        """
+        cache = get_node_cache()
+        if cache is None:
+            return node
+
+        async def run_cached(state: LabState) -> Dict[str, Any]:
+            key = cache.make_key(
+                "node", name, *(state.get(field, "") for field in key_fields)
+            )
+
+            cached = cache.get(key)
+            if cached is not None:
+                logger.info("node_cache_hit", node=name)
+                update = orjson.loads(cached)
+                update["iteration_count"] = state.get("iteration_count", 0) + 1
+                return update
+
+            update = await node(state)
+            if not update.get("error_messages"):
+                cache.set(key, orjson.dumps(
+                    {k: v for k, v in update.items() if k != "iteration_count"}
+                ).decode())
+            return update
+
+        return run_cached
+
+    def _streaming_node(
+        self, agent: BaseAgent, *downstream: BaseAgent
+    ) -> _Node:
+        """Create a node that streams an agent and warms downstream prefixes.
+
+        Once the agent has generated enough output to be clearly on its way,
+        the static system prefixes of the downstream agents are sent to the
+        provider so its prompt cache is primed by the time they run.
+        """
+
+        def warm_downstream() -> None:
+            if not self.settings.prompt_cache_warming:
+                return
+            
+            for next_agent in downstream:
+                task = asyncio.create_task(next_agent.awarm_prefix())
+                # Keep a reference so the task is not garbage collected early
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+        async def run_agent(state: LabState) -> Dict[str, Any]:
+            return await agent.aexecute_streamed(
+                state, on_prefix=warm_downstream, prefix_chars=_WARM_AFTER_CHARS
+            )
+
+        return run_agent
+
+    def _parallel_node(self, *nodes: _Node) -> _Node:
+        """Create a node that runs independent nodes concurrently.
+
+        Nodes are awaited together with ``asyncio.gather`` and their state
+        updates merged into a single update, so the node takes as long as the
+        slowest one rather than the sum of all of them.
+        """
+
+        async def run_agents(state: LabState) -> Dict[str, Any]:
+            results = await asyncio.gather(*(node(state) for node in nodes))
+
+            errors: list[str] = []
+            merged: Dict[str, Any] = {}
+
+            for result in results:
+                errors.extend(result.pop("error_messages", ()))
+                merged.update(result)
+
+            merged["iteration_count"] = max(
+                result["iteration_count"] for result in results
+            )
+            if errors:
+                merged["error_messages"] = errors
+
+            return merged
+
+        return run_agents
+
+    def _should_retry(
+        self, state: LabState
+    ) -> Literal["retry", "research", "proceed"]:
+        """Determine if workflow should retry based on critic and bias scores."""
         try:
+            critic_score = state.get("critic_score", 0.0)
+            bias_score = state.get("bias_score", 1.0)
+            threshold = self.settings.critic_threshold
+            
+            # Exit early when the first pass is already good enough
+            if critic_score >= threshold and bias_score < self.settings.bias_threshold:
+                return "proceed"
+            
             max_iterations = self.settings.max_retries
             current_iteration = state.get("iteration_count", 0)
             
-            # Check iteration limit first
+            # Check iteration limit
             if current_iteration >= max_iterations:
                 logger.warning(
                     "max_iterations_reached", 
@@ -100,20 +254,20 @@ class WorkflowBuilder:
                 )
                 return "proceed"
             
-            # Check critic score
-            critic_score = state.get("critic_score", 0.0)
-            threshold = self.settings.critic_threshold
-            
-            if critic_score < threshold:
-                logger.info(
-                    "retry_due_to_low_score",
-                    score=critic_score,
-                    threshold=threshold,
-                    iteration=current_iteration
-                )
-                return "retry"
+            # Research is redone only when the critic blames it
+            research_gaps = bool(
+                _RESEARCH_GAP.search(state.get("critic_feedback", ""))
+            )
             
-            return "proceed"
+            logger.info(
+                "retry_due_to_low_score",
+                score=critic_score,
+                threshold=threshold,
+                bias_score=bias_score,
+                research_gaps=research_gaps,
+                iteration=current_iteration
+            )
+            return "research" if research_gaps else "retry"
             
         except Exception as e:
             logger.error("retry_decision_failed", error=str(e))
@@ -122,19 +276,12 @@ class WorkflowBuilder:
     def _finalize_output(self, state: LabState) -> Dict[str, Any]:
         """Create final markdown output."""
         try:
-            sections = []
-            
-            if state.get("requirements"):
-                sections.append(f"# Requirements\n{state['requirements']}")
-            
-            if state.get("research"):
-                sections.append(f"# Research Notes\n{state['research']}")
-            
-            if state.get("architecture"):
-                sections.append(f"# Architecture Design\n{state['architecture']}")
+            buf = io.StringIO()
             
-            if state.get("visualization"):
-                sections.append(f"# Visualization\n{state['visualization']}")
+            for field, title in _OUTPUT_SECTIONS:
+                if state.get(field):
+                    self._write_section(buf, title)
+                    buf.write(state[field])
             
             # Add evaluation section
             eval_section = []
@@ -148,9 +295,10 @@ class WorkflowBuilder:
                 eval_section.append(f"**Bias Risk:** {state['bias_score']}")
             
             if eval_section:
-                sections.append(f"# Evaluation\n" + "\n".join(eval_section))
+                self._write_section(buf, "Evaluation")
+                buf.write("\n".join(eval_section))
             
-            final_markdown = "\n\n---\n\n".join(sections)
+            final_markdown = buf.getvalue()
             
             logger.info("output_finalized", length=len(final_markdown))
             
@@ -160,11 +308,58 @@ class WorkflowBuilder:
             logger.error("finalization_failed", error=str(e))
             return {
                 "final_markdown": "Error generating final output",
-                "error_messages": state.get("error_messages", []) + [str(e)]
+                "error_messages": [str(e)]
             }
 
+    @staticmethod
+    def _write_section(buf: io.StringIO, title: str) -> None:
+        """Write a section heading, separated from any previous section."""
+        if buf.tell():
+            buf.write(_SECTION_SEPARATOR)
+        buf.write(f"# {title}\n")
 
+
+@lru_cache(maxsize=1)
 def get_workflow() -> StateGraph:
-    """Get the compiled workflow graph."""
+    """Get the compiled workflow graph, built once per process."""
     builder = WorkflowBuilder()
-    return builder.build_graph()
\ No newline at end of file
+    return builder.build_graph()
+
+
+async def run_batch(
+    queries: Iterable[str], max_in_flight: int = 32
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """Run many queries through the workflow, yielding results as they finish."""
+    workflow = get_workflow()
+    pending = iter(queries)
+    in_flight: Dict["asyncio.Task[Dict[str, Any]]", str] = {}
+    
+    try:
+        while True:
+            # Top up to the ceiling as soon as any run completes
+            for query in itertools.islice(pending, max_in_flight - len(in_flight)):
+                task = asyncio.create_task(
+                    workflow.ainvoke(create_initial_state(query))
+                )
+                in_flight[task] = query
+            
+            if not in_flight:
+                return
+            
+            done, _ = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                query = in_flight.pop(task)
+                error = task.exception()
+                if error is None:
+                    yield query, task.result()
+                    continue
+                
+                logger.error("batch_query_failed", query=query[:100], error=str(error))
+                result = create_initial_state(query)
+                result["error_messages"] = [str(error)]
+                yield query, result
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -1,6 +1,7 @@
 """LangGraph state schema with type safety."""
 
-from typing import Optional
+import operator
+from typing import Annotated, Optional
 from typing_extensions import TypedDict
 
 
@@ -24,7 +25,8 @@ class LabState(TypedDict):
     
     # Metadata
     iteration_count: int
-    error_messages: list[str]
+    # Nodes return only new messages; LangGraph appends them
+    error_messages: Annotated[list[str], operator.add]
 
 
 class AgentResponse(TypedDict):
@@ -32,4 +34,20 @@ class AgentResponse(TypedDict):
     
     content: str
     confidence: float
-    metadata: dict[str, str]
\ No newline at end of file
+    metadata: dict[str, str]
+
+def create_initial_state(query: str) -> LabState:
+    """Create the workflow state for a new query."""
+    return {
+        "user_query": query,
+        "requirements": "",
+        "research": "",
+        "architecture": "",
+        "visualization": "",
+        "critic_score": 0.0,
+        "critic_feedback": "",
+        "bias_score": 0.0,
+        "final_markdown": "",
+        "iteration_count": 0,
+        "error_messages": [],
+    }
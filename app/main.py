@@ -7,13 +7,14 @@ import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.config import get_settings
 from app.core.logging import setup_logging
+from app.api.middleware import REQUEST_ID, RequestContextMiddleware
 from app.api.routes import router
 from app.monitoring.metrics import RequestMetricsMiddleware, start_metrics_server
 from app.schemas.api import ErrorResponse
@@ -55,6 +56,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
@@ -73,6 +75,9 @@ def create_app() -> FastAPI:
     # Metrics middleware
     app.add_middleware(RequestMetricsMiddleware)
     
+    # Request ID and log context, added last so it wraps the other middleware
+    app.add_middleware(RequestContextMiddleware)
+    
     # Global exception handlers
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -80,17 +85,16 @@ def create_app() -> FastAPI:
         
         logger.warning(
             "validation_error",
-            path=request.url.path,
             errors=exc.errors()
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content=ErrorResponse(
                 error="Validation failed",
                 error_code="VALIDATION_ERROR",
-                request_id=getattr(request.state, "request_id", None)
-            ).model_dump(mode="json")
+                request_id=REQUEST_ID.get()
+            ).model_dump()
         )
     
     @app.exception_handler(StarletteHTTPException)
@@ -99,18 +103,17 @@ def create_app() -> FastAPI:
         
         logger.warning(
             "http_exception",
-            path=request.url.path,
             status_code=exc.status_code,
             detail=exc.detail
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=ErrorResponse(
                 error=exc.detail,
                 error_code=f"HTTP_{exc.status_code}",
-                request_id=getattr(request.state, "request_id", None)
-            ).model_dump(mode="json")
+                request_id=REQUEST_ID.get()
+            ).model_dump()
         )
     
     @app.exception_handler(Exception)
@@ -119,18 +122,17 @@ def create_app() -> FastAPI:
         
         logger.error(
             "unexpected_exception",
-            path=request.url.path,
             error=str(exc),
             exc_info=True
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=ErrorResponse(
                 error="Internal server error",
                 error_code="INTERNAL_ERROR",
-                request_id=getattr(request.state, "request_id", None)
-            ).model_dump(mode="json")
+                request_id=REQUEST_ID.get()
+            ).model_dump()
         )
     
     # Include routers
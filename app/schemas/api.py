@@ -1,10 +1,14 @@
 """Pydantic schemas for API requests and responses."""
 
+import re
 from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+# Keywords rejected in queries, matched case-insensitively in a single pass
+_UNSAFE_QUERY = re.compile("script|eval|exec", re.IGNORECASE)
+
 
 class AnalyzeRequest(BaseModel):
     """Request schema for analysis endpoint."""
@@ -24,7 +28,7 @@ class AnalyzeRequest(BaseModel):
             raise ValueError("Query cannot be empty or only whitespace")
         
         # Basic security checks
-        if any(keyword in v.lower() for keyword in ["script", "eval", "exec"]):
+        if _UNSAFE_QUERY.search(v):
             raise ValueError("Query contains potentially unsafe content")
         
         return v.strip()
@@ -1,9 +1,12 @@
 """Security utilities and helpers."""
 
+import re
 import secrets
 import hashlib
-from typing import Optional
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+from datetime import datetime
 
 import structlog
 from fastapi import HTTPException, Request
@@ -13,6 +16,15 @@ from app.core.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Basic XSS prevention, matched case-insensitively in a single pass
+_DANGEROUS_PATTERNS = (
+    "<script>", "</script>", "javascript:",
+    "onload=", "onerror=", "eval(", "exec("
+)
+_DANGEROUS_CONTENT = re.compile(
+    "|".join(map(re.escape, _DANGEROUS_PATTERNS)), re.IGNORECASE
+)
+
 
 class APIKeyAuth(HTTPBearer):
     """API Key authentication."""
@@ -69,29 +81,27 @@ class RateLimiter:
     def __init__(self, max_requests: int = 60, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = {}
+        # Monotonic request timestamps per identifier, oldest first
+        self.requests: Dict[str, Deque[float]] = {}
     
     async def check_rate_limit(self, identifier: str) -> bool:
         """Check if request is within rate limit."""
         
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=self.window_seconds)
+        # No awaits below, so the check-and-append is atomic on the event loop
+        now = time.monotonic()
+        cutoff = now - self.window_seconds
+        timestamps = self.requests.setdefault(identifier, deque())
         
         # Clean old entries
-        if identifier in self.requests:
-            self.requests[identifier] = [
-                req_time for req_time in self.requests[identifier]
-                if req_time > window_start
-            ]
-        else:
-            self.requests[identifier] = []
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
         
         # Check limit
-        if len(self.requests[identifier]) >= self.max_requests:
+        if len(timestamps) >= self.max_requests:
             return False
         
         # Add current request
-        self.requests[identifier].append(now)
+        timestamps.append(now)
         return True
 
 
@@ -105,27 +115,20 @@ class SecurityUtils:
     
     @staticmethod
     def hash_string(value: str, salt: str = "") -> str:
-        """Hash a string with optional salt."""
-        combined = f"{value}{salt}"
-        return hashlib.sha256(combined.encode()).hexdigest()
+        """Hash a string with optional salt, used as the BLAKE2b key."""
+        key = salt.encode()
+        if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+            key = hashlib.blake2b(key).digest()
+        return hashlib.blake2b(value.encode(), digest_size=16, key=key).hexdigest()
     
     @staticmethod
     def validate_content(content: str) -> bool:
         """Validate content for potential security issues."""
-        
-        # Basic XSS prevention
-        dangerous_patterns = [
-            "<script>", "</script>", "javascript:", 
-            "onload=", "onerror=", "eval(", "exec("
-        ]
-        
-        content_lower = content.lower()
-        return not any(pattern in content_lower for pattern in dangerous_patterns)
+        return _DANGEROUS_CONTENT.search(content) is None
     
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize a filename for safe filesystem operations."""
-        import re
         
         # Remove dangerous characters
         safe_filename = re.sub(r'[^\w\-_\.]', '_', filename)
@@ -1,5 +1,6 @@
 """CLI runner for ArcSys."""
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -8,19 +9,76 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from app.graph.builder import get_workflow
+from app.graph.builder import get_workflow, run_batch
+from app.graph.state import create_initial_state
 from app.core.logging import setup_logging
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run ArcSys from command line.")
+    parser.add_argument("query", nargs="*", help="System design query")
+    parser.add_argument(
+        "--file",
+        type=Path,
+        help="File with one query per line, analyzed concurrently"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=32,
+        help="Maximum concurrent workflow runs when using --file"
+    )
+    return parser.parse_args()
+
+
+def print_result(result: dict) -> None:
+    """Print a workflow result."""
+    print("\n" + "=" * 60)
+    print("ANALYSIS RESULTS")
+    print("=" * 60)
+    
+    print(f"\nFinal Output:\n{result.get('final_markdown', 'No output generated')}")
+    print(f"\nCritic Score: {result.get('critic_score', 0.0)}/10")
+    print(f"Bias Score: {result.get('bias_score', 0.0)}")
+    print(f"Iterations: {result.get('iteration_count', 0)}")
+    
+    if result.get('error_messages'):
+        print(f"\nErrors: {result['error_messages']}")
+
+
+async def run_file(path: Path, max_in_flight: int) -> None:
+    """Analyze every non-empty line of a file as a separate query."""
+    with path.open(encoding="utf-8") as f:
+        queries = [line.strip() for line in f if line.strip()]
+    
+    print(f"Analyzing {len(queries)} queries from {path}")
+    print("-" * 50)
+    
+    async for query, result in run_batch(queries, max_in_flight=max_in_flight):
+        print(f"\nQuery: {query}")
+        print_result(result)
+
+
 async def main():
     """Run ArcSys from command line."""
     
     # Setup logging
     setup_logging()
     
+    args = parse_args()
+    
+    if args.file:
+        try:
+            await run_file(args.file, args.max_in_flight)
+        except Exception as e:
+            print(f"Error during analysis: {e}")
+            sys.exit(1)
+        return
+    
     # Get user query
-    if len(sys.argv) > 1:
-        query = " ".join(sys.argv[1:])
+    if args.query:
+        query = " ".join(args.query)
     else:
         query = input("Enter your system design query: ")
     
@@ -35,36 +93,11 @@ async def main():
         # Build workflow
         workflow = get_workflow()
         
-        # Initial state
-        initial_state = {
-            "user_query": query,
-            "requirements": "",
-            "research": "",
-            "architecture": "",
-            "visualization": "",
-            "critic_score": 0.0,
-            "critic_feedback": "",
-            "bias_score": 0.0,
-            "final_markdown": "",
-            "iteration_count": 0,
-            "error_messages": [],
-        }
-        
         # Execute workflow
-        result = workflow.invoke(initial_state)
+        result = await workflow.ainvoke(create_initial_state(query))
         
         # Display results
-        print("\n" + "=" * 60)
-        print("ANALYSIS RESULTS")
-        print("=" * 60)
-        
-        print(f"\nFinal Output:\n{result.get('final_markdown', 'No output generated')}")
-        print(f"\nCritic Score: {result.get('critic_score', 0.0)}/10")
-        print(f"Bias Score: {result.get('bias_score', 0.0)}")
-        print(f"Iterations: {result.get('iteration_count', 0)}")
-        
-        if result.get('error_messages'):
-            print(f"\nErrors: {result['error_messages']}")
+        print_result(result)
         
     except Exception as e:
         print(f"Error during analysis: {e}")
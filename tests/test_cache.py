@@ -0,0 +1,77 @@
+"""Tests for response caching layers."""
+
+import numpy as np
+
+from app.cache.semantic import SemanticCache
+from app.core.llm_cache import LLMCache
+
+
+def _unit(*values: float) -> np.ndarray:
+    """Build a normalized float32 vector."""
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class TestSemanticCache:
+    """Test semantic cache lookups."""
+    
+    def test_empty_cache_misses(self):
+        """Test lookup on an empty cache."""
+        cache = SemanticCache("unused", threshold=0.9, max_entries=4)
+        assert cache.search(_unit(1.0, 0.0)) is None
+    
+    def test_similar_query_hits(self):
+        """Test that near-duplicate embeddings return the cached value."""
+        cache = SemanticCache("unused", threshold=0.9, max_entries=4)
+        cache.add(_unit(1.0, 0.0), "url shortener")
+        cache.add(_unit(0.0, 1.0), "chat service")
+        
+        assert cache.search(_unit(1.0, 0.1)) == "url shortener"
+        assert cache.search(_unit(1.0, 1.0)) is None
+    
+    def test_oldest_entry_evicted(self):
+        """Test ring-buffer eviction once the cache is full."""
+        cache = SemanticCache("unused", threshold=0.99, max_entries=2)
+        cache.add(_unit(1.0, 0.0, 0.0), "first")
+        cache.add(_unit(0.0, 1.0, 0.0), "second")
+        cache.add(_unit(0.0, 0.0, 1.0), "third")
+        
+        assert cache.search(_unit(1.0, 0.0, 0.0)) is None
+        assert cache.search(_unit(0.0, 1.0, 0.0)) == "second"
+        assert cache.search(_unit(0.0, 0.0, 1.0)) == "third"
+
+
+class TestLLMCache:
+    """Test exact-match LLM response cache."""
+    
+    def test_roundtrip(self):
+        """Test cached responses are returned for identical keys."""
+        cache = LLMCache()
+        key = cache.make_key("model", 0.1, "system", "prompt")
+        
+        assert cache.get(key) is None
+        cache.set(key, "response")
+        assert cache.get(key) == "response"
+    
+    def test_key_depends_on_all_parts(self):
+        """Test different prompts or temperatures produce different keys."""
+        key = LLMCache.make_key("model", 0.1, "system", "prompt")
+        
+        assert key != LLMCache.make_key("model", 0.2, "system", "prompt")
+        assert key != LLMCache.make_key("model", 0.1, "system", "other")
+    
+    def test_expired_entry_misses(self):
+        """Test entries are dropped after their TTL."""
+        cache = LLMCache(ttl=-1)
+        cache.set("key", "response")
+        assert cache.get("key") is None
+    
+    def test_oldest_entry_evicted(self):
+        """Test the in-memory backend stays bounded."""
+        cache = LLMCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.set("c", "3")
+        
+        assert cache.get("a") is None
+        assert cache.get("c") == "3"
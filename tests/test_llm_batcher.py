@@ -0,0 +1,92 @@
+"""Tests for LLM request micro-batching."""
+
+import asyncio
+
+import pytest
+
+from app.core.llm_batcher import LLMBatcher
+
+
+class FakeClient:
+    """Chat model stub recording batched inputs."""
+    
+    def __init__(self):
+        self.batches = []
+    
+    async def abatch(self, inputs, return_exceptions=False):
+        self.batches.append(list(inputs))
+        await asyncio.sleep(0.01)
+        return [
+            ValueError("failed") if value == "bad" else f"response:{value}"
+            for value in inputs
+        ]
+
+
+class TestLLMBatcher:
+    """Test batching and coalescing of concurrent calls."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_batches(self):
+        """Test concurrent calls are grouped up to the batch size."""
+        client = FakeClient()
+        batcher = LLMBatcher(client, max_batch_size=2, window=0.05, cost_fn=len)
+        
+        results = await asyncio.gather(*(batcher.ainvoke(v) for v in "abc"))
+        
+        assert results == ["response:a", "response:b", "response:c"]
+        assert client.batches == [["a", "b"], ["c"]]
+    
+    @pytest.mark.asyncio
+    async def test_prompts_bucketed_by_length(self):
+        """Test short and long prompts are sent in separate batches."""
+        client = FakeClient()
+        batcher = LLMBatcher(client, max_batch_size=8, window=0.01, cost_fn=len)
+        short, long = "s" * 10, "l" * 4000
+        
+        await asyncio.gather(
+            batcher.ainvoke(short),
+            batcher.ainvoke(long),
+            batcher.ainvoke(short),
+        )
+        
+        assert sorted(client.batches, key=len) == [[long], [short, short]]
+    
+    @pytest.mark.asyncio
+    async def test_batch_cost_limited(self):
+        """Test a bucket is flushed before exceeding the cost limit."""
+        client = FakeClient()
+        batcher = LLMBatcher(
+            client, max_batch_size=8, window=0.01, cost_fn=len, max_cost_per_batch=5000
+        )
+        
+        await asyncio.gather(*(batcher.ainvoke("l" * 3000) for _ in range(2)))
+        
+        assert [len(batch) for batch in client.batches] == [1, 1]
+    
+    @pytest.mark.asyncio
+    async def test_identical_keys_coalesced(self):
+        """Test calls with the same key are answered by one request."""
+        client = FakeClient()
+        batcher = LLMBatcher(client, max_batch_size=8, window=0.01, cost_fn=len)
+        
+        results = await asyncio.gather(
+            batcher.ainvoke("a", key="same"),
+            batcher.ainvoke("a", key="same"),
+        )
+        
+        assert results == ["response:a", "response:a"]
+        assert client.batches == [["a"]]
+    
+    @pytest.mark.asyncio
+    async def test_errors_delivered_per_call(self):
+        """Test a failed call does not fail the rest of its batch."""
+        client = FakeClient()
+        batcher = LLMBatcher(client, max_batch_size=8, window=0.01, cost_fn=len)
+        
+        ok, failed = await asyncio.gather(
+            batcher.ainvoke("a"),
+            batcher.ainvoke("bad"),
+            return_exceptions=True,
+        )
+        assert ok == "response:a"
+        assert isinstance(failed, ValueError)